@@ -1,12 +1,91 @@
-from pymongo import MongoClient
+from pymongo import ASCENDING, IndexModel, MongoClient
+from pymongo.errors import OperationFailure
+from datetime import datetime, timezone
 import os
 
 client = None
 
+# Soft-deleted documents are purged this long after `deleted_at` is set
+SOFT_DELETE_TTL_SECONDS = int(os.getenv("SOFT_DELETE_TTL_DAYS", "30")) * 24 * 60 * 60
+
+# Live documents carry an explicit `is_deleted: False` so that reads can use
+# partial indexes; a `$ne: True` predicate can never be served by one.
+ACTIVE = {"is_deleted": False}
+
+INDEXES = {
+    "applicants": [
+        IndexModel(
+            [("is_deleted", ASCENDING), ("_id", ASCENDING)],
+            name="active_applicants",
+            partialFilterExpression=ACTIVE,
+        ),
+    ],
+    # Only read by _id, which the default _id index already serves
+    "transactions": [],
+    "key_financial_indicators": [],
+}
+
+SOFT_DELETE_TTL_INDEX = "soft_deleted_ttl"
+
+# One-time data migrations are recorded here by name once they have run
+MIGRATIONS_COLLECTION = "migrations"
+BACKFILL_IS_DELETED = "backfill_is_deleted"
+
+
 def get_db():
     return client.get_database(os.getenv("DATABASE_NAME"))
 
+
 def init_db():
     global client
     mongodb_url = os.getenv("MONGODB_URI")
-    client = MongoClient(mongodb_url)
\ No newline at end of file
+    client = MongoClient(mongodb_url)
+    ensure_indexes(get_db())
+
+
+def ensure_indexes(db):
+    """
+    Creates the indexes in INDEXES plus a TTL index that purges soft-deleted
+    documents. Idempotent, so it runs on every startup; an index whose options
+    changed (e.g. a new TTL) is dropped and recreated.
+    """
+    backfill_is_deleted(db)
+    for collection_name, indexes in INDEXES.items():
+        collection = db[collection_name]
+        ttl_index = IndexModel(
+            [("deleted_at", ASCENDING)],
+            name=SOFT_DELETE_TTL_INDEX,
+            expireAfterSeconds=SOFT_DELETE_TTL_SECONDS,
+            partialFilterExpression={"is_deleted": True},
+        )
+        for index in indexes + [ttl_index]:
+            try:
+                collection.create_indexes([index])
+            except OperationFailure as e:
+                # IndexOptionsConflict / IndexKeySpecsConflict
+                if e.code not in (85, 86):
+                    raise
+                collection.drop_index(index.document["name"])
+                collection.create_indexes([index])
+
+
+def backfill_is_deleted(db):
+    """
+    Marks documents written before `is_deleted` was always set as live.
+
+    No index can serve the `$exists: False` filter, so this scans every
+    collection; it runs once per database and is then recorded in
+    MIGRATIONS_COLLECTION.
+    """
+    migrations = db[MIGRATIONS_COLLECTION]
+    if migrations.find_one({"_id": BACKFILL_IS_DELETED}) is not None:
+        return
+    for collection_name in INDEXES:
+        db[collection_name].update_many(
+            {"is_deleted": {"$exists": False}}, {"$set": {"is_deleted": False}}
+        )
+    migrations.update_one(
+        {"_id": BACKFILL_IS_DELETED},
+        {"$set": {"completed_at": datetime.now(timezone.utc)}},
+        upsert=True,
+    )
@@ -0,0 +1,263 @@
+import asyncio
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Set
+
+from bson.objectid import ObjectId
+from fastapi.encoders import jsonable_encoder
+
+# Events a slow client may fall behind by before it is told to resync
+EVENT_QUEUE_SIZE = int(os.getenv("EVENT_QUEUE_SIZE", "256"))
+# Use MongoDB change streams (requires a replica set) instead of the in-process bus
+CHANGE_STREAMS_ENABLED = os.getenv("CHANGE_STREAMS_ENABLED", "false").lower() == "true"
+# Most transaction inserts a change stream folds into one insert_many event
+INSERT_EVENT_BATCH_SIZE = int(os.getenv("INSERT_EVENT_BATCH_SIZE", "5000"))
+
+WATCHED_COLLECTIONS = ("applicants", "transactions", "key_financial_indicators")
+# Fields that are never pushed to clients: large, or carried by their own events
+UNPUBLISHED_FIELDS = ("_id", "raw_bank_statement_txt", "transactions", "key_financial_indicators", "is_deleted")
+
+RESYNC_EVENT = json.dumps({"type": "resync"})
+
+
+class Subscription:
+    """One client's bounded queue of serialized events."""
+
+    def __init__(self, applicant_id: Optional[str]):
+        self.applicant_id = applicant_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+
+    def push(self, message: str) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # The client is too far behind for deltas to be useful; drop what
+            # is queued and ask it to re-fetch the applicant once instead.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC_EVENT)
+
+
+class EventBus:
+    """
+    Fans out change events to subscribed clients.
+
+    Each event is serialized once and the same string is queued for every
+    matching subscription, so the cost per client is one queue insert.
+    Subscriptions are indexed by applicant id; `None` receives everything.
+    """
+
+    def __init__(self):
+        self.subscriptions: Dict[Optional[str], Set[Subscription]] = {}
+
+    def subscribe(self, applicant_id: Optional[str] = None) -> Subscription:
+        subscription = Subscription(applicant_id)
+        self.subscriptions.setdefault(applicant_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscriptions = self.subscriptions.get(subscription.applicant_id)
+        if subscriptions is not None:
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self.subscriptions[subscription.applicant_id]
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        targets = self.subscriptions.get(None, set()) | self.subscriptions.get(
+            event.get("applicant_id"), set()
+        )
+        if not targets:
+            return
+        message = json.dumps(jsonable_encoder(event, custom_encoder={ObjectId: str}))
+        for subscription in targets:
+            subscription.push(message)
+
+
+event_bus = EventBus()
+
+
+def make_event(
+    collection: str,
+    operation: str,
+    document_id: Any,
+    applicant_id: Optional[str],
+    fields: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """A per-document delta: only the fields that changed are included."""
+    return {
+        "type": "change",
+        "collection": collection,
+        "operation": operation,
+        "document_id": str(document_id),
+        "applicant_id": applicant_id,
+        "fields": {
+            key: value
+            for key, value in (fields or {}).items()
+            if key not in UNPUBLISHED_FIELDS
+        },
+    }
+
+
+def make_batch_event(
+    collection: str, applicant_id: Optional[str], documents: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """One event for many inserted documents; each carries its own `id`."""
+    return {
+        "type": "change",
+        "collection": collection,
+        "operation": "insert_many",
+        "applicant_id": applicant_id,
+        "count": len(documents),
+        "documents": [
+            {key: value for key, value in document.items() if key not in UNPUBLISHED_FIELDS}
+            for document in documents
+        ],
+    }
+
+
+def publish_change(
+    collection: str,
+    operation: str,
+    document_id: Any,
+    applicant_id: Optional[str],
+    fields: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Called by the routes after each write. With change streams enabled the
+    same change arrives from MongoDB, so nothing is published here.
+    """
+    if CHANGE_STREAMS_ENABLED:
+        return
+    event_bus.publish(make_event(collection, operation, document_id, applicant_id, fields))
+
+
+def publish_inserts(
+    collection: str, applicant_id: Optional[str], documents: List[Dict[str, Any]]
+) -> None:
+    """Like `publish_change`, for a bulk insert: one event for the whole chunk."""
+    if CHANGE_STREAMS_ENABLED or not documents:
+        return
+    event_bus.publish(make_batch_event(collection, applicant_id, documents))
+
+
+class ChangeStreamWatcher:
+    """
+    Feeds MongoDB change stream events into the event bus from a worker thread.
+
+    A bulk insert arrives as one change per transaction. Consecutive
+    transaction inserts for the same applicant are buffered and published as
+    one insert_many event when the stream goes idle, the applicant changes,
+    any other change arrives or INSERT_EVENT_BATCH_SIZE is reached.
+    """
+
+    def __init__(self, db, loop: asyncio.AbstractEventLoop):
+        self.db = db
+        self.loop = loop
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="change-stream", daemon=True)
+        self.pending_applicant_id: Optional[str] = None
+        self.pending_inserts: List[Dict[str, Any]] = []
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stopped.set()
+        self.thread.join(timeout=5)
+
+    def _run(self) -> None:
+        pipeline = [
+            {"$match": {"ns.coll": {"$in": list(WATCHED_COLLECTIONS)}}},
+            # updateLookup is only needed for applicant_id; keep the rest small
+            {"$project": {
+                "fullDocument.raw_bank_statement_txt": 0,
+                "fullDocument.transactions": 0,
+                "fullDocument.key_financial_indicators": 0,
+            }},
+        ]
+        resume_token = None
+        while not self.stopped.is_set():
+            try:
+                with self.db.watch(
+                    pipeline,
+                    full_document="updateLookup",
+                    resume_after=resume_token,
+                    max_await_time_ms=1000,
+                ) as stream:
+                    while not self.stopped.is_set():
+                        change = stream.try_next()
+                        resume_token = stream.resume_token
+                        if change is None:
+                            self._flush_inserts()
+                            continue
+                        event = self._to_event(change)
+                        if event is None:
+                            continue
+                        if event["collection"] == "transactions" and event["operation"] == "insert":
+                            self._buffer_insert(event)
+                        else:
+                            self._flush_inserts()
+                            self._publish(event)
+            except Exception as e:
+                print(f"Change stream error, reconnecting: {e}")
+                self.stopped.wait(1)
+            finally:
+                self._flush_inserts()
+
+    def _publish(self, event: Dict[str, Any]) -> None:
+        self.loop.call_soon_threadsafe(event_bus.publish, event)
+
+    def _buffer_insert(self, event: Dict[str, Any]) -> None:
+        if self.pending_inserts and (
+            event["applicant_id"] != self.pending_applicant_id
+            or len(self.pending_inserts) >= INSERT_EVENT_BATCH_SIZE
+        ):
+            self._flush_inserts()
+        self.pending_applicant_id = event["applicant_id"]
+        self.pending_inserts.append({**event["fields"], "id": event["document_id"]})
+
+    def _flush_inserts(self) -> None:
+        if not self.pending_inserts:
+            return
+        documents, self.pending_inserts = self.pending_inserts, []
+        if len(documents) == 1:
+            # A single insert keeps the per-document event shape
+            fields = dict(documents[0])
+            document_id = fields.pop("id")
+            self._publish(
+                make_event("transactions", "insert", document_id, self.pending_applicant_id, fields)
+            )
+        else:
+            self._publish(make_batch_event("transactions", self.pending_applicant_id, documents))
+
+    @staticmethod
+    def _to_event(change: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        collection = change["ns"]["coll"]
+        document_id = change["documentKey"]["_id"]
+        full_document = change.get("fullDocument") or {}
+        applicant_id = (
+            str(document_id) if collection == "applicants" else full_document.get("applicant_id")
+        )
+
+        operation = change["operationType"]
+        if operation == "insert":
+            fields = full_document
+        elif operation in ("update", "replace"):
+            if operation == "update":
+                fields = change["updateDescription"]["updatedFields"]
+            else:
+                fields = full_document
+            # Soft deletes are updates in MongoDB but deletes to clients
+            operation = "delete" if fields.get("is_deleted") is True else "update"
+            # Embedded copies on the applicant are published by their own collections
+            fields = {key: value for key, value in fields.items() if "." not in key}
+        elif operation == "delete":
+            fields = {}
+        else:
+            return None
+
+        event = make_event(collection, operation, document_id, applicant_id, fields)
+        if operation == "update" and not event["fields"]:
+            return None
+        return event
@@ -1,7 +1,9 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routes import applicant, transaction, key_financial_indicator
-from app.db import init_db
+from app.routes import admin, applicant, events, transaction, key_financial_indicator
+from app.db import get_db, init_db
+from app.events import CHANGE_STREAMS_ENABLED, ChangeStreamWatcher
 
 app = FastAPI()
 
@@ -15,12 +17,23 @@ app.add_middleware(
 
 async def startup_event():
     init_db()
+    app.state.change_stream_watcher = None
+    if CHANGE_STREAMS_ENABLED:
+        app.state.change_stream_watcher = ChangeStreamWatcher(get_db(), asyncio.get_running_loop())
+        app.state.change_stream_watcher.start()
+
+async def shutdown_event():
+    if app.state.change_stream_watcher is not None:
+        app.state.change_stream_watcher.stop()
 
 app.add_event_handler("startup", startup_event)
+app.add_event_handler("shutdown", shutdown_event)
 
 app.include_router(applicant.router)
 app.include_router(transaction.router)
 app.include_router(key_financial_indicator.router)
+app.include_router(admin.router)
+app.include_router(events.router)
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,69 @@
+from fastapi import APIRouter
+from bson.objectid import ObjectId
+from app.db import ACTIVE, get_db
+
+router = APIRouter()
+
+# The find filters issued by the CRUD routes, with placeholder ids; the plan
+# shape does not depend on the actual values.
+MAIN_QUERIES = {
+    "list_applicants": ("applicants", ACTIVE),
+    "get_applicant": ("applicants", {"_id": ObjectId(), **ACTIVE}),
+    "get_transaction": ("transactions", {"_id": ObjectId(), **ACTIVE}),
+    "get_kfi": ("key_financial_indicators", {"_id": ObjectId(), **ACTIVE}),
+}
+
+
+def _plan_stages(plan: dict) -> list:
+    """Flattens a winning plan into its stages, outermost first."""
+    stages = []
+    while plan:
+        stage = {"stage": plan.get("stage")}
+        if "indexName" in plan:
+            stage["index"] = plan["indexName"]
+        stages.append(stage)
+        if "inputStage" in plan:
+            plan = plan["inputStage"]
+        elif plan.get("inputStages"):
+            plan = plan["inputStages"][0]
+        else:
+            plan = None
+    return stages
+
+
+@router.get("/admin/query-plans")
+async def get_query_plans():
+    """
+    Reports the winning plan of every main query and whether it falls back to
+    a collection scan, so a missing or unusable index shows up in production.
+    """
+    db = get_db()
+    plans = {}
+    for name, (collection_name, query) in MAIN_QUERIES.items():
+        winning_plan = db[collection_name].find(query).explain()["queryPlanner"]["winningPlan"]
+        # Plans from the slot-based engine wrap the classic tree in "queryPlan"
+        stages = _plan_stages(winning_plan.get("queryPlan", winning_plan))
+        plans[name] = {
+            "collection": collection_name,
+            "stages": stages,
+            "collection_scan": any(stage["stage"] == "COLLSCAN" for stage in stages),
+        }
+    return plans
+
+
+@router.get("/admin/index-usage")
+async def get_index_usage():
+    """Per-index access counts since the server started, from `$indexStats`."""
+    db = get_db()
+    usage = {}
+    for collection_name in ("applicants", "transactions", "key_financial_indicators"):
+        usage[collection_name] = [
+            {
+                "name": stats["name"],
+                "key": stats["key"],
+                "ops": stats["accesses"]["ops"],
+                "since": stats["accesses"]["since"],
+            }
+            for stats in db[collection_name].aggregate([{"$indexStats": {}}])
+        ]
+    return usage
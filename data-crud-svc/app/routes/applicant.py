@@ -1,7 +1,9 @@
 from fastapi import APIRouter, HTTPException
 from typing import List
+from datetime import datetime, timezone
 from bson.objectid import ObjectId
-from app.db import get_db
+from app.db import ACTIVE, get_db
+from app.events import publish_change
 from app.models.applicant import Applicant
 
 router = APIRouter()
@@ -9,15 +11,16 @@ router = APIRouter()
 @router.post("/applicants/", response_model=Applicant, status_code=201)
 async def create_applicant(applicant: Applicant):
     db = get_db()
-    result = db.applicants.insert_one(applicant.model_dump(exclude_unset=True))
+    result = db.applicants.insert_one({**applicant.model_dump(exclude_unset=True), **ACTIVE})
     applicant.id = str(result.inserted_id)
+    publish_change("applicants", "insert", applicant.id, applicant.id, applicant.model_dump(exclude_unset=True))
     return applicant
 
 @router.get("/applicants/", response_model=List[Applicant])
 async def get_applicants():
     db = get_db()
     applicants = []
-    for doc in db.applicants.find({"is_deleted": {"$ne": True}}):
+    for doc in db.applicants.find(ACTIVE):
         doc["id"] = str(doc["_id"])
         applicants.append(Applicant(**doc))
     return applicants
@@ -25,7 +28,7 @@ async def get_applicants():
 @router.get("/applicants/{applicant_id}", response_model=Applicant)
 async def get_applicant(applicant_id: str):
     db = get_db()
-    applicant = db.applicants.find_one({"_id": ObjectId(applicant_id), "is_deleted": {"$ne": True}})
+    applicant = db.applicants.find_one({"_id": ObjectId(applicant_id), **ACTIVE})
     if applicant:
         applicant["id"] = str(applicant["_id"])
         return Applicant(**applicant)
@@ -35,20 +38,22 @@ async def get_applicant(applicant_id: str):
 async def update_applicant(applicant_id: str, applicant: Applicant):
     db = get_db()
     result = db.applicants.update_one(
-        {"_id": ObjectId(applicant_id)},
+        {"_id": ObjectId(applicant_id), **ACTIVE},
         {"$set": applicant.model_dump(exclude_unset=True)}
     )
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="Applicant not found")
+    publish_change("applicants", "update", applicant_id, applicant_id, applicant.model_dump(exclude_unset=True))
     return applicant
 
 @router.delete("/applicants/{applicant_id}", status_code=200)
 async def delete_applicant(applicant_id: str):
     db = get_db()
     result = db.applicants.update_one(
-        {"_id": ObjectId(applicant_id)},
-        {"$set": {"is_deleted": True}}
+        {"_id": ObjectId(applicant_id), **ACTIVE},
+        {"$set": {"is_deleted": True, "deleted_at": datetime.now(timezone.utc)}}
     )
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="Applicant not found")
+    publish_change("applicants", "delete", applicant_id, applicant_id)
     return {"message": "Applicant soft deleted"}
\ No newline at end of file
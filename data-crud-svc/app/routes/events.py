@@ -0,0 +1,57 @@
+import asyncio
+import os
+from fastapi import APIRouter, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from app.events import event_bus
+
+router = APIRouter()
+
+# Idle connections get a heartbeat this often, which is also when a client
+# that went away without closing is noticed
+HEARTBEAT_SECONDS = float(os.getenv("EVENT_HEARTBEAT_SECONDS", "15"))
+HEARTBEAT_EVENT = '{"type": "heartbeat"}'
+
+
+@router.websocket("/ws/events")
+async def stream_events_websocket(websocket: WebSocket, applicant_id: Optional[str] = None):
+    """
+    Pushes applicant, transaction and KFI changes as per-document deltas.
+    Pass `applicant_id` to receive only the changes for one applicant.
+    """
+    await websocket.accept()
+    subscription = event_bus.subscribe(applicant_id)
+    try:
+        while True:
+            try:
+                message = await asyncio.wait_for(subscription.queue.get(), HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                message = HEARTBEAT_EVENT
+            await websocket.send_text(message)
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        event_bus.unsubscribe(subscription)
+
+
+@router.get("/events")
+async def stream_events_sse(request: Request, applicant_id: Optional[str] = None):
+    """Server-sent events variant of `/ws/events`, for clients that cannot open a WebSocket."""
+    async def event_stream():
+        subscription = event_bus.subscribe(applicant_id)
+        try:
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(subscription.queue.get(), HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+                yield f"data: {message}\n\n"
+        finally:
+            event_bus.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
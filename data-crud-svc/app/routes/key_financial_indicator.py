@@ -1,6 +1,8 @@
 from fastapi import APIRouter, HTTPException
+from datetime import datetime, timezone
 from bson.objectid import ObjectId
-from app.db import get_db
+from app.db import ACTIVE, get_db
+from app.events import publish_change
 from app.models.key_financial_indicator import KeyFinancialIndicator
 
 router = APIRouter()
@@ -8,18 +10,21 @@ router = APIRouter()
 @router.post("/applicants/{applicant_id}/kfis/", response_model=KeyFinancialIndicator, status_code=201)
 async def create_kfi(applicant_id: str, kfi: KeyFinancialIndicator):
     db = get_db()
-    result = db.key_financial_indicators.insert_one(kfi.model_dump(exclude_unset=True))
+    result = db.key_financial_indicators.insert_one(
+        {**kfi.model_dump(exclude_unset=True), "applicant_id": applicant_id, **ACTIVE}
+    )
     kfi.id = str(result.inserted_id)
     db.applicants.update_one(
         {"_id": ObjectId(applicant_id)},
         {"$set": {"key_financial_indicators": kfi.model_dump()}}
     )
+    publish_change("key_financial_indicators", "insert", kfi.id, applicant_id, kfi.model_dump(exclude_unset=True))
     return kfi
 
 @router.get("/applicants/{applicant_id}/kfis/{kfi_id}", response_model=KeyFinancialIndicator)
 async def get_kfi(applicant_id: str, kfi_id: str):
     db = get_db()
-    kfi = db.key_financial_indicators.find_one({"_id": ObjectId(kfi_id), "is_deleted": {"$ne": True}})
+    kfi = db.key_financial_indicators.find_one({"_id": ObjectId(kfi_id), **ACTIVE})
     if kfi:
         kfi["id"] = str(kfi["_id"])
         return KeyFinancialIndicator(**kfi)
@@ -29,7 +34,7 @@ async def get_kfi(applicant_id: str, kfi_id: str):
 async def update_kfi(applicant_id: str, kfi_id: str, kfi: KeyFinancialIndicator):
     db = get_db()
     result = db.key_financial_indicators.update_one(
-        {"_id": ObjectId(kfi_id)},
+        {"_id": ObjectId(kfi_id), **ACTIVE},
         {"$set": kfi.model_dump(exclude_unset=True)}
     )
     if result.modified_count == 0:
@@ -38,14 +43,15 @@ async def update_kfi(applicant_id: str, kfi_id: str, kfi: KeyFinancialIndicator)
         {"_id": ObjectId(applicant_id)},
         {"$set": {"key_financial_indicators": kfi.model_dump()}}
     )
+    publish_change("key_financial_indicators", "update", kfi_id, applicant_id, kfi.model_dump(exclude_unset=True))
     return kfi
 
 @router.delete("/applicants/{applicant_id}/kfis/{kfi_id}", status_code=200)
 async def delete_kfi(applicant_id: str, kfi_id: str):
     db = get_db()
     result = db.key_financial_indicators.update_one(
-        {"_id": ObjectId(kfi_id)},
-        {"$set": {"is_deleted": True}}
+        {"_id": ObjectId(kfi_id), **ACTIVE},
+        {"$set": {"is_deleted": True, "deleted_at": datetime.now(timezone.utc)}}
     )
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="Key Financial Indicator not found")
@@ -53,4 +59,5 @@ async def delete_kfi(applicant_id: str, kfi_id: str):
         {"_id": ObjectId(applicant_id)},
         {"$unset": {"key_financial_indicators": 1}} # Changed from "" to 1
     )
+    publish_change("key_financial_indicators", "delete", kfi_id, applicant_id)
     return {"message": "Key Financial Indicator soft deleted"}
\ No newline at end of file
@@ -1,11 +1,17 @@
+import os
 from fastapi import APIRouter, HTTPException, Request
 from typing import List
+from datetime import datetime, timezone
 from bson.objectid import ObjectId
-from app.db import get_db
+from app.db import ACTIVE, get_db
+from app.events import publish_change, publish_inserts
 from app.models.transaction import Transaction
+from app.wire_format import decode_transactions
 
 router = APIRouter()
 
+BULK_INSERT_CHUNK_SIZE = int(os.getenv("BULK_INSERT_CHUNK_SIZE", "5000"))
+
 
 @router.post(
     "/applicants/{applicant_id}/transactions/",
@@ -14,12 +20,15 @@ router = APIRouter()
 )
 async def create_transaction(applicant_id: str, transaction: Transaction):
     db = get_db()
-    result = db.transactions.insert_one(transaction.model_dump(exclude_unset=True))
+    result = db.transactions.insert_one(
+        {**transaction.model_dump(exclude_unset=True), "applicant_id": applicant_id, **ACTIVE}
+    )
     transaction.id = str(result.inserted_id)
     db.applicants.update_one(
         {"_id": ObjectId(applicant_id)},
         {"$push": {"transactions": transaction.model_dump()}},
     )
+    publish_change("transactions", "insert", transaction.id, applicant_id, transaction.model_dump())
     return transaction
 
 
@@ -27,41 +36,53 @@ async def create_transaction(applicant_id: str, transaction: Transaction):
     "/applicants/{applicant_id}/transactions/bulk/",
     status_code=201,
 )
-async def create_bulk_transactions(applicant_id: str, transactions: List[Transaction], request: Request):
+async def create_bulk_transactions(applicant_id: str, request: Request):
     """
     Bulk creates transactions for an applicant.
-    """
-    raw_body = await request.json()  # Parse the raw JSON body
-    # print("Raw Request Body:", raw_body)
-
-    # print(transactions)
-    transaction_dicts = [
-        transaction.model_dump(exclude_unset=True) for transaction in transactions
-    ]
-
-    # print("transactions_dicts STARTS HERE =============================\n\n")
-
-    db = get_db()
-    result = db.transactions.insert_many(transaction_dicts)
-    inserted_ids = result.inserted_ids
-
-    created_transactions = []
-    transaction_dumps_for_applicant = []
-
-    for i, transaction in enumerate(transactions):
-        transaction.id = str(inserted_ids[i])
-        created_transactions.append(transaction)
-        transaction_dumps_for_applicant.append(
-            transaction.model_dump()
-        )  # Use model_dump here to keep consistency with single transaction endpoint
 
-    db.applicants.update_one(
-        {"_id": ObjectId(applicant_id)},
-        {"$push": {"transactions": {"$each": transaction_dumps_for_applicant}}},
+    The body is a list of transactions as JSON or MessagePack (chosen by
+    Content-Type), optionally gzip- or zstd-compressed (Content-Encoding).
+    """
+    transactions = decode_transactions(
+        await request.body(),
+        request.headers.get("content-type"),
+        request.headers.get("content-encoding"),
     )
+    insert_transactions(get_db(), applicant_id, transactions)
     return {"message": "Transactions have been added"}
 
 
+def insert_transactions(db, applicant_id: str, transactions: List[Transaction]) -> None:
+    """
+    Inserts transactions in chunks of BULK_INSERT_CHUNK_SIZE, so a very large
+    statement never builds a single oversized insert or $push command.
+    """
+    empty_transaction = Transaction().model_dump()
+    for start in range(0, len(transactions), BULK_INSERT_CHUNK_SIZE):
+        transaction_dicts = [
+            {**transaction.model_dump(exclude_unset=True), "applicant_id": applicant_id, **ACTIVE}
+            for transaction in transactions[start : start + BULK_INSERT_CHUNK_SIZE]
+        ]
+        result = db.transactions.insert_many(transaction_dicts)
+
+        # Reuse the dicts for the applicant's embedded copy instead of dumping
+        # every model a second time, keeping only the Transaction fields.
+        transaction_dumps_for_applicant = []
+        for transaction_dict, inserted_id in zip(transaction_dicts, result.inserted_ids):
+            transaction_dump = {
+                key: transaction_dict.get(key, default)
+                for key, default in empty_transaction.items()
+            }
+            transaction_dump["id"] = str(inserted_id)
+            transaction_dumps_for_applicant.append(transaction_dump)
+
+        db.applicants.update_one(
+            {"_id": ObjectId(applicant_id)},
+            {"$push": {"transactions": {"$each": transaction_dumps_for_applicant}}},
+        )
+        publish_inserts("transactions", applicant_id, transaction_dumps_for_applicant)
+
+
 @router.get(
     "/applicants/{applicant_id}/transactions/{transaction_id}",
     response_model=Transaction,
@@ -69,7 +90,7 @@ async def create_bulk_transactions(applicant_id: str, transactions: List[Transac
 async def get_transaction(applicant_id: str, transaction_id: str):
     db = get_db()
     transaction = db.transactions.find_one(
-        {"_id": ObjectId(transaction_id), "is_deleted": {"$ne": True}}
+        {"_id": ObjectId(transaction_id), **ACTIVE}
     )
     if transaction:
         transaction["id"] = str(transaction["_id"])
@@ -83,7 +104,7 @@ async def get_transaction(applicant_id: str, transaction_id: str):
 async def get_transactions(applicant_id: str):
     db = get_db()
     applicant = db.applicants.find_one(
-        {"_id": ObjectId(applicant_id), "is_deleted": {"$ne": True}}
+        {"_id": ObjectId(applicant_id), **ACTIVE}
     )
     if not applicant:
         raise HTTPException(status_code=404, detail="Applicant not found")
@@ -101,7 +122,7 @@ async def update_transaction(
 ):
     db = get_db()
     result = db.transactions.update_one(
-        {"_id": ObjectId(transaction_id)},
+        {"_id": ObjectId(transaction_id), **ACTIVE},
         {"$set": transaction.model_dump(exclude_unset=True)},
     )
     if result.modified_count == 0:
@@ -114,6 +135,10 @@ async def update_transaction(
             {"element.id": transaction_id}
         ],  # More robust update using array_filters
     )
+    publish_change(
+        "transactions", "update", transaction_id, applicant_id,
+        transaction.model_dump(exclude_unset=True),
+    )
     return transaction
 
 
@@ -123,7 +148,8 @@ async def update_transaction(
 async def delete_transaction(applicant_id: str, transaction_id: str):
     db = get_db()
     result = db.transactions.update_one(
-        {"_id": ObjectId(transaction_id)}, {"$set": {"is_deleted": True}}
+        {"_id": ObjectId(transaction_id), **ACTIVE},
+        {"$set": {"is_deleted": True, "deleted_at": datetime.now(timezone.utc)}},
     )
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="Transaction not found")
@@ -132,4 +158,5 @@ async def delete_transaction(applicant_id: str, transaction_id: str):
         {"_id": ObjectId(applicant_id)},
         {"$pull": {"transactions": {"id": transaction_id}}},
     )
+    publish_change("transactions", "delete", transaction_id, applicant_id)
     return {"message": "Transaction soft deleted"}
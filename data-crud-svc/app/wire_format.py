@@ -0,0 +1,127 @@
+import json
+import os
+import zlib
+from typing import Any, List, Optional
+
+import msgpack
+import zstandard
+from fastapi import HTTPException
+from pydantic import TypeAdapter, ValidationError
+
+from app.models.transaction import Transaction
+
+JSON_CONTENT_TYPES = ("application/json",)
+MSGPACK_CONTENT_TYPES = ("application/msgpack", "application/x-msgpack")
+
+# Upper bound on a request body after decompression (413 above it)
+MAX_DECOMPRESSED_BYTES = int(os.getenv("BULK_MAX_DECOMPRESSED_BYTES", str(64 * 1024 * 1024)))
+# zstd input is fed in slices this small so that a decompression bomb is
+# stopped after a bounded amount of output rather than fully expanded
+ZSTD_INPUT_SLICE_BYTES = 1024
+
+transaction_list_adapter = TypeAdapter(List[Transaction])
+
+
+def decompress(body: bytes, content_encoding: Optional[str]) -> bytes:
+    encoding = (content_encoding or "identity").strip().lower()
+    if encoding == "identity":
+        data = body
+    elif encoding == "gzip":
+        data = _gunzip(body)
+    elif encoding == "zstd":
+        data = _unzstd(body)
+    else:
+        raise HTTPException(
+            status_code=415, detail=f"Unsupported Content-Encoding: {content_encoding}"
+        )
+    if len(data) > MAX_DECOMPRESSED_BYTES:
+        raise _too_large()
+    return data
+
+
+def _gunzip(body: bytes) -> bytes:
+    # A gzip body may hold several members back to back, like `cat a.gz b.gz`
+    chunks = []
+    size = 0
+    remaining = body
+    try:
+        while remaining:
+            decompressor = zlib.decompressobj(wbits=31)  # 31: gzip header and trailer
+            chunk = decompressor.decompress(remaining, MAX_DECOMPRESSED_BYTES - size + 1)
+            size += len(chunk)
+            if size > MAX_DECOMPRESSED_BYTES:
+                raise _too_large()
+            if not decompressor.eof:
+                raise HTTPException(status_code=400, detail="Invalid gzip body: truncated stream")
+            chunks.append(chunk)
+            remaining = decompressor.unused_data
+    except zlib.error as e:
+        raise HTTPException(status_code=400, detail=f"Invalid gzip body: {e}")
+    return b"".join(chunks)
+
+
+def _unzstd(body: bytes) -> bytes:
+    # Streaming decompressor: frames written without a content size are
+    # accepted, and a body may hold several frames back to back
+    zstd = zstandard.ZstdDecompressor()
+    view = memoryview(body)
+    chunks = []
+    size = 0
+    frame_start = 0
+    try:
+        while frame_start < len(body):
+            decompressor = zstd.decompressobj()
+            position = frame_start
+            while not decompressor.eof and position < len(body):
+                input_slice = view[position:position + ZSTD_INPUT_SLICE_BYTES]
+                position += len(input_slice)
+                chunk = decompressor.decompress(input_slice)
+                size += len(chunk)
+                if size > MAX_DECOMPRESSED_BYTES:
+                    raise _too_large()
+                chunks.append(chunk)
+            if not decompressor.eof:
+                raise HTTPException(status_code=400, detail="Invalid zstd body: truncated stream")
+            # The last slice may run into the next frame
+            frame_start = position - len(decompressor.unused_data)
+    except zstandard.ZstdError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid zstd body: {e}")
+    return b"".join(chunks)
+
+
+def _too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"Decompressed body exceeds {MAX_DECOMPRESSED_BYTES} bytes",
+    )
+
+
+def decode_transactions(
+    body: bytes, content_type: Optional[str], content_encoding: Optional[str]
+) -> List[Transaction]:
+    """
+    Decodes and validates a bulk transactions body in a single pass.
+
+    Supports JSON and MessagePack, optionally gzip- or zstd-compressed.
+    """
+    media_type = (content_type or "application/json").split(";")[0].strip().lower()
+    body = decompress(body, content_encoding)
+
+    try:
+        if media_type in JSON_CONTENT_TYPES:
+            # pydantic parses and validates the JSON bytes in one go
+            return transaction_list_adapter.validate_json(body)
+        if media_type in MSGPACK_CONTENT_TYPES:
+            payload: Any = msgpack.unpackb(body, raw=False)
+            return transaction_list_adapter.validate_python(payload)
+    except ValidationError as e:
+        if all(error["type"] == "json_invalid" for error in e.errors()):
+            # Not JSON at all: a malformed body rather than an invalid transaction
+            raise HTTPException(status_code=400, detail=f"Malformed body: {e}")
+        raise HTTPException(status_code=422, detail=json.loads(e.json()))
+    except ValueError as e:  # includes every msgpack unpacking error
+        raise HTTPException(status_code=400, detail=f"Malformed body: {e}")
+
+    raise HTTPException(
+        status_code=415, detail=f"Unsupported Content-Type: {content_type}"
+    )
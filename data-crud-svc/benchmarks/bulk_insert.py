@@ -0,0 +1,112 @@
+"""
+Bulk transactions throughput, in rows per second, before and after the wire
+format changes to `create_bulk_transactions`.
+
+"legacy" replays what the endpoint used to do: parse the JSON body twice,
+validate it as List[Transaction] and model_dump every row twice. The other
+cases go through `decode_transactions` with each supported wire format.
+
+Decoding and validation are always measured. When MONGODB_URI is set, the
+full insert is measured as well, against a scratch `bulk_insert_benchmark`
+database that is dropped afterwards.
+
+Usage (from ./data-crud-svc):
+    python benchmarks/bulk_insert.py [rows]
+"""
+import gzip
+import json
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+import msgpack
+import zstandard
+from bson.objectid import ObjectId
+from pydantic import TypeAdapter
+from pymongo import MongoClient
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.transaction import Transaction  # noqa: E402
+from app.routes.transaction import insert_transactions  # noqa: E402
+from app.wire_format import decode_transactions  # noqa: E402
+
+
+def make_rows(count: int) -> list:
+    start = date(2024, 1, 1)
+    return [
+        {
+            "date": (start + timedelta(days=i % 365)).isoformat() + "T00:00:00",
+            "description": f"UPI/{i:06d}/MERCHANT {i % 300}",
+            "transaction_type": "credit" if i % 3 == 0 else "debit",
+            "amount": round(5 + (i * 37) % 2500 + 0.25, 2),
+            "balance": round(10000 + (i * 13) % 5000 + 0.5, 2),
+            "currency": "INR",
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_decode(body: bytes, content_type, content_encoding) -> List[Transaction]:
+    transactions = TypeAdapter(List[Transaction]).validate_python(json.loads(body))
+    json.loads(body)  # the unused `await request.json()`
+    return transactions
+
+
+def legacy_insert(db, applicant_id: str, transactions: List[Transaction]) -> None:
+    result = db.transactions.insert_many(
+        [transaction.model_dump(exclude_unset=True) for transaction in transactions]
+    )
+    dumps = []
+    for i, transaction in enumerate(transactions):
+        transaction.id = str(result.inserted_ids[i])
+        dumps.append(transaction.model_dump())
+    db.applicants.update_one(
+        {"_id": ObjectId(applicant_id)},
+        {"$push": {"transactions": {"$each": dumps}}},
+    )
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    rows = make_rows(count)
+    json_body = json.dumps(rows).encode()
+    msgpack_body = msgpack.packb(rows)
+
+    cases = [
+        ("legacy json", legacy_decode, legacy_insert, json_body, "application/json", None),
+        ("json", decode_transactions, insert_transactions, json_body, "application/json", None),
+        ("json+gzip", decode_transactions, insert_transactions,
+         gzip.compress(json_body, compresslevel=5), "application/json", "gzip"),
+        ("msgpack+zstd", decode_transactions, insert_transactions,
+         zstandard.ZstdCompressor().compress(msgpack_body), "application/msgpack", "zstd"),
+    ]
+
+    mongodb_uri = os.getenv("MONGODB_URI")
+    client = MongoClient(mongodb_uri) if mongodb_uri else None
+    db = client.get_database("bulk_insert_benchmark") if client else None
+
+    print(f"{count} rows")
+    try:
+        for name, decode, insert, body, content_type, content_encoding in cases:
+            start = time.perf_counter()
+            transactions = decode(body, content_type, content_encoding)
+            decode_seconds = time.perf_counter() - start
+            line = f"{name:>14}: {len(body) / 1024:9.1f} KiB  decode {count / decode_seconds:10.0f} rows/s"
+
+            if db is not None:
+                applicant_id = str(db.applicants.insert_one({"name": name}).inserted_id)
+                start = time.perf_counter()
+                insert(db, applicant_id, transactions)
+                insert_seconds = time.perf_counter() - start
+                line += f"  insert {count / (decode_seconds + insert_seconds):10.0f} rows/s end-to-end"
+            print(line)
+    finally:
+        if client is not None:
+            client.drop_database("bulk_insert_benchmark")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
+import asyncio
 from fastapi import FastAPI
-from app.routes import process_bank_statement
+from app.routes import health, process_bank_statement
 from app.services.data_crud_client import DataCRUDClient
+from app.services.warmup import warm_up
 from fastapi.middleware.cors import CORSMiddleware
 
 app = FastAPI(title="Data Ingestion Service", version="1.0.0")
@@ -15,9 +17,12 @@ app.add_middleware(
 
 async def startup_event():
     app.state.data_crud_client = DataCRUDClient()
+    # Load numpy/pdfplumber/openai in the background; /readyz reports when done
+    app.state.warmup_task = asyncio.create_task(warm_up())
 
 app.add_event_handler("startup", startup_event)
 
+app.include_router(health.router)
 app.include_router(process_bank_statement.router, prefix="/api/v1")
 
 if __name__ == "__main__":
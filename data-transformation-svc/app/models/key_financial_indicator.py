@@ -17,3 +17,10 @@ class KeyFinancialIndicator(BaseModel):
     savings_rate_score: Optional[float] = None
     liquidity_ratio_score: Optional[float] = None
     overdraft_penalty_score: Optional[float] = None
+    extraction_confidence: Optional[float] = None
+    monthly_payroll_income: Optional[float] = None
+    monthly_rent: Optional[float] = None
+    monthly_loan_repayments: Optional[float] = None
+    monthly_gambling_spend: Optional[float] = None
+    debt_service_ratio: Optional[float] = None
+    gambling_spend_ratio: Optional[float] = None
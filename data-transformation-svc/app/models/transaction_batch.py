@@ -0,0 +1,215 @@
+import csv
+import numpy as np
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+CSV_COLUMNS = ("date", "description", "transaction_type", "amount", "balance", "currency")
+
+
+class TransactionBatch:
+    """
+    Columnar representation of a bank statement's transactions.
+
+    Each field of `Transaction` is held as one NumPy array so the ingestion
+    pipeline (CSV parsing, validation, KFI calculation and serialization) can
+    work on whole columns instead of one dict/model per row.
+    """
+
+    __slots__ = (
+        "dates",
+        "descriptions",
+        "transaction_types",
+        "amounts",
+        "balances",
+        "currencies",
+        "parse_errors",
+    )
+
+    def __init__(
+        self,
+        dates: np.ndarray,
+        descriptions: np.ndarray,
+        transaction_types: np.ndarray,
+        amounts: np.ndarray,
+        balances: np.ndarray,
+        currencies: np.ndarray,
+        parse_errors: Optional[np.ndarray] = None,
+    ):
+        self.dates = dates  # datetime64[D], NaT when missing or not YYYY-MM-DD
+        self.descriptions = descriptions  # object array of str
+        self.transaction_types = transaction_types  # str array, as extracted
+        self.amounts = amounts  # float64, NaN when missing
+        self.balances = balances  # float64, NaN when missing
+        self.currencies = currencies  # str array
+        self.parse_errors = (
+            parse_errors if parse_errors is not None else np.zeros(len(dates), dtype=bool)
+        )
+
+    def __len__(self) -> int:
+        return self.dates.shape[0]
+
+    def __getitem__(self, rows) -> "TransactionBatch":
+        """Selects rows by slice, index array or boolean mask."""
+        return TransactionBatch(
+            *(getattr(self, name)[rows] for name in self.__slots__)
+        )
+
+    @classmethod
+    def concatenate(cls, batches: List["TransactionBatch"]) -> "TransactionBatch":
+        return cls(
+            *(
+                np.concatenate([getattr(batch, name) for batch in batches])
+                for name in cls.__slots__
+            )
+        )
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, List[Any]]) -> "TransactionBatch":
+        size = len(columns.get("date", ()))
+        empty = [""] * size
+
+        dates, date_errors = _parse_dates(columns.get("date", empty))
+        # A blank amount has always failed validation; a blank balance is allowed
+        amounts, amount_errors = _parse_floats(columns.get("amount", empty), required=True)
+        balances, balance_errors = _parse_floats(columns.get("balance", empty), required=False)
+
+        return cls(
+            dates=dates,
+            descriptions=np.array(columns.get("description", empty), dtype=object),
+            transaction_types=np.array(columns.get("transaction_type", empty), dtype=str),
+            amounts=amounts,
+            balances=balances,
+            currencies=np.char.strip(np.array(columns.get("currency", empty), dtype=str)),
+            parse_errors=date_errors | amount_errors | balance_errors,
+        )
+
+    @classmethod
+    def from_csv(cls, csv_content: str) -> "TransactionBatch":
+        """Parses the LLM's CSV output straight into columns."""
+        reader = csv.reader(line.strip() for line in csv_content.splitlines())
+        header = next(reader, None)
+        if not header:
+            return cls.from_columns({name: [] for name in CSV_COLUMNS})
+
+        positions = {
+            name.strip().lower(): i for i, name in enumerate(header) if name.strip()
+        }
+        columns = {name: [] for name in CSV_COLUMNS if name in positions}
+        targets = [(columns[name], positions[name]) for name in columns]
+        for row in reader:
+            if not row:
+                continue
+            for column, position in targets:
+                column.append(row[position] if position < len(row) else "")
+
+        size = max((len(column) for column in columns.values()), default=0)
+        for name in CSV_COLUMNS:
+            columns.setdefault(name, [""] * size)
+        return cls.from_columns(columns)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "TransactionBatch":
+        records = list(records)
+        return cls.from_columns(
+            {
+                name: [_record_value(record.get(name)) for record in records]
+                for name in CSV_COLUMNS
+            }
+        )
+
+    def invalid_rows(self) -> np.ndarray:
+        """Indices of rows with an unparseable value or no usable date."""
+        return np.flatnonzero(self.parse_errors | np.isnat(self.dates))
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Serializes the batch for the data-crud-svc bulk endpoint.
+
+        Dates are rendered as ISO datetimes and missing amounts are omitted,
+        matching `Transaction.model_dump(exclude_none=True)`. A missing balance
+        has always been stored as 0.0.
+        """
+        dates = self.dates.astype("datetime64[s]").astype(str).tolist()
+        descriptions = self.descriptions.tolist()
+        transaction_types = self.transaction_types.tolist()
+        amounts = self.amounts.tolist()
+        has_amount = (~np.isnan(self.amounts)).tolist()
+        balances = np.nan_to_num(self.balances, nan=0.0).tolist()
+        currencies = self.currencies.tolist()
+
+        records = []
+        for i in range(len(self)):
+            record = {
+                "date": dates[i],
+                "description": descriptions[i],
+                "transaction_type": transaction_types[i],
+                "balance": balances[i],
+                "currency": currencies[i],
+            }
+            if has_amount[i]:
+                record["amount"] = amounts[i]
+            records.append(record)
+        return records
+
+
+def _record_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, date):
+        # datetime is a subclass of date; only the calendar date is kept
+        return value.strftime("%Y-%m-%d")
+    return value
+
+
+def _parse_dates(values: List[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parses strict YYYY-MM-DD dates, as `strptime(value, "%Y-%m-%d")` did.
+
+    numpy alone also accepts "2024", "2024-02" or "today"; rendering the
+    parsed date back to text and comparing it with the input rejects those.
+    Empty values become NaT without being flagged here.
+    """
+    stripped = np.char.strip(np.array(values, dtype=str))
+    candidates = np.where(np.char.str_len(stripped) == 10, stripped, "NaT")
+    try:
+        dates = candidates.astype("datetime64[D]")
+    except ValueError:
+        # Slow path: only reached when a 10-character value is not a date
+        dates = np.full(candidates.shape[0], np.datetime64("NaT"), dtype="datetime64[D]")
+        for i, value in enumerate(candidates.tolist()):
+            try:
+                dates[i] = np.datetime64(value, "D")
+            except ValueError:
+                continue
+
+    errors = (stripped != "") & (dates.astype(str) != stripped)
+    dates[errors] = np.datetime64("NaT")
+    return dates, errors
+
+
+def _parse_floats(values: List[Any], required: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parses numbers; blank values become NaN and are errors only if `required`.
+
+    "nan" and "inf" are rejected as well: they are not amounts, and orjson
+    would send them to data-crud-svc as null.
+    """
+    cleaned = np.char.strip(np.array(values, dtype=str))
+    blank = cleaned == ""
+    errors = blank.copy() if required else np.zeros(cleaned.shape[0], dtype=bool)
+    try:
+        floats = np.where(blank, "nan", cleaned).astype(np.float64)
+    except ValueError:
+        # Slow path: only reached when at least one value is malformed
+        floats = np.full(cleaned.shape[0], np.nan)
+        for i, value in enumerate(cleaned.tolist()):
+            if blank[i]:
+                continue
+            try:
+                floats[i] = float(value)
+            except ValueError:
+                errors[i] = True
+
+    not_finite = ~blank & ~np.isfinite(floats)
+    floats[not_finite] = np.nan
+    return floats, errors | not_finite
@@ -0,0 +1,22 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from app.services import warmup
+
+router = APIRouter()
+
+
+@router.get("/healthz")
+async def liveness():
+    return {"status": "alive"}
+
+
+@router.get("/readyz")
+async def readiness():
+    body = {
+        "ready": warmup.state["ready"],
+        "error": warmup.state["error"],
+        "import_seconds": warmup.state["import_seconds"],
+    }
+    if not warmup.state["ready"]:
+        return JSONResponse(status_code=503, content=body)
+    return body
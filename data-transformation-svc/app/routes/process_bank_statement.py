@@ -1,19 +1,18 @@
 # ./data-transformation-svc/app/routes/process_bank_statement.py
 from fastapi import APIRouter, HTTPException, UploadFile, File
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any
 
 from pydantic import ValidationError
 from app.models.applicant import Applicant
-from app.models.transaction import Transaction
 from app.services.pdf_parser import parse_pdf
 from app.services.llm_processor import process_text_with_llm
 from app.services.data_crud_client import DataCRUDClient
 import uuid
 import inspect
-from datetime import datetime
-import numpy as np  # Import numpy
 from app.models.key_financial_indicator import KeyFinancialIndicator
-from app.services.kfi_calculator import calculate_kfi  # Import the service
+
+if TYPE_CHECKING:
+    from app.models.transaction_batch import TransactionBatch
 
 router = APIRouter()
 data_crud_client = DataCRUDClient()
@@ -76,59 +75,44 @@ async def update_applicant_with_raw_text(applicant_id: str, raw_text: str) -> No
 
 async def process_and_store_transactions(
     applicant_id: str, raw_text: str
-) -> List[Dict[str, any]]:  # Return the transaction list
+) -> "TransactionBatch":  # Return the transaction batch
     print("Reached " + inspect.currentframe().f_code.co_name)
-    transactions_csv_list = await process_text_with_llm(raw_text)
+    from app.services.reconciliation import reconcile_and_reextract
 
-    for transaction_dict in transactions_csv_list:
-        transaction_dict["date"] = datetime.strptime(
-            transaction_dict["date"], "%Y-%m-%d"
-        )
+    transactions = await process_text_with_llm(raw_text)
+    transactions = await reconcile_and_reextract(raw_text, transactions)
 
-    transactions_list = [
-        transaction.model_dump(exclude_none=True)
-        for transaction in [
-            Transaction(**transaction_dict)
-            for transaction_dict in transactions_csv_list
-        ]
-    ]
-    transactions_list = [
-        {key: convert_datetime_to_string(value) for key, value in transaction.items()}
-        for transaction in transactions_list
-    ]
+    invalid_rows = transactions.invalid_rows()
+    if invalid_rows.size:
+        print(f"Invalid transaction rows: {invalid_rows.tolist()}")
+        raise HTTPException(
+            status_code=500, detail="Failed to validate transaction data"
+        )
 
     try:
         response = await data_crud_client.create_transactions(
-            applicant_id, transactions_list
+            applicant_id, transactions.to_records()
         )
         if not response:
             raise HTTPException(status_code=500, detail="Failed to store transactions")
-        return transactions_list  # Return processed transactions
+        return transactions  # Return processed transactions
 
     except HTTPException as e:
         if e.status_code == 422:
             print(f"Validation error occurred: {e.detail}")
-            print(f"Error response: {e.response.json()}")
         else:
             print(f"HTTP error occurred: {e}")
         raise  # Re-raise the exception to be caught in the main handler
 
-    except ValidationError as e:
-        print(f"Pydantic validation error: {e.json()}")
-        raise HTTPException(
-            status_code=500, detail="Failed to validate transaction data"
-        )  # Convert ValidationError to HTTPException
-
 
-def convert_datetime_to_string(obj):
-    if isinstance(obj, datetime):
-        return obj.isoformat()  # Convert datetime to ISO format string
-    return obj
-
-
-async def process_and_store_kfi(applicant_id: str, transactions: List[Dict[str, any]]):
+async def process_and_store_kfi(applicant_id: str, transactions: "TransactionBatch"):
     print("Reached " + inspect.currentframe().f_code.co_name)
+    # Both import numpy at module level
+    from app.services.kfi_calculator import calculate_kfi
+    from app.services.reconciliation import reconcile
+
     kfi_data = calculate_kfi(transactions)  # Use the imported function
+    kfi_data["extraction_confidence"] = reconcile(transactions).confidence
     print(kfi_data)
     kfi_model = KeyFinancialIndicator(**kfi_data)
 
@@ -0,0 +1,167 @@
+# ./data-transformation-svc/app/services/categorizer.py
+import functools
+import inspect
+import re
+import ahocorasick
+import numpy as np
+from typing import Dict, Iterable, Optional, Tuple
+
+UNCATEGORIZED = "uncategorized"
+
+# Merchant names and keywords per category, matched as whole words against
+# the normalized description. When several match, the longest keyword wins;
+# the category listed first only breaks ties between keywords of equal length.
+# Short tokens that are also common names or words ("emi", "sal", "coral")
+# are only listed together with the word that qualifies them.
+CATEGORY_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "gambling": (
+        "bet365", "betway", "betfair", "paddy power", "william hill", "ladbrokes",
+        "skybet", "sky bet", "coral bet", "coral sports", "pokerstars", "casino",
+        "dream11", "my11circle", "mpl games", "mobile premier league", "rummy",
+        "rummycircle", "junglee rummy", "lottery", "draftkings", "fanduel",
+        "stake.com",
+    ),
+    "loan_repayment": (
+        "loan emi", "emi debit", "loan", "loan repayment", "mortgage", "home loan",
+        "car loan", "personal loan", "bajaj finance", "bajaj finserv", "hdb financial",
+        "tata capital", "credit card payment", "klarna", "afterpay", "affirm",
+    ),
+    "rent": ("rent", "house rent", "rental", "landlord", "nobroker", "letting"),
+    "payroll": (
+        "salary", "sal cr", "payroll", "wages", "wage", "stipend", "pay credit",
+        "adp", "gusto",
+    ),
+    "utilities": (
+        "electricity", "water bill", "gas bill", "broadband", "bescom", "tneb",
+        "british gas", "octopus energy", "thames water", "jio", "airtel",
+        "vodafone", "comcast", "verizon",
+    ),
+    "cash_withdrawal": ("atm", "cash withdrawal", "atw cash", "nfs wdl", "nfs cash"),
+}
+
+# Fallbacks for descriptions the keyword automaton cannot express
+CATEGORY_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    "loan_repayment": (
+        r"\bach\b.*\b(?:emi|loan)",
+        r"\bnach\b.*\bfin",
+        r"\bemi\b.*\b(?:debit|dr|ach|nach|si)\b",
+    ),
+    "payroll": (r"\bsal(?:ary)?\s*(?:for|cr)\b", r"\bneft\b.*\bpayroll"),
+    "rent": (r"\brent\s*(?:for|payment)\b",),
+}
+
+MEMO_SIZE = 65536
+
+# Reference/account numbers (4+ digits) and punctuation
+_NOISE = re.compile(r"\d{4,}|[#*_/\\|:.,;()\[\]-]+")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_description(description: Optional[str]) -> str:
+    """Drops reference numbers and punctuation so repeated merchants share a memo entry."""
+    if not description:
+        return ""
+    return _SPACES.sub(" ", _NOISE.sub(" ", str(description).lower())).strip()
+
+
+class Categorizer:
+    """
+    Classifies transaction descriptions into spending categories.
+
+    Keywords are compiled into a single Aho-Corasick automaton, so matching
+    costs one pass over the description regardless of the rule count; regexes
+    only run when no keyword matched. Results are memoized per normalized
+    description, which makes repeated merchant strings nearly free.
+    """
+
+    def __init__(
+        self,
+        keywords: Dict[str, Iterable[str]] = CATEGORY_KEYWORDS,
+        patterns: Dict[str, Iterable[str]] = CATEGORY_PATTERNS,
+        memo_size: int = MEMO_SIZE,
+    ):
+        self.categories = tuple(keywords) + tuple(
+            category for category in patterns if category not in keywords
+        )
+        priority = {category: i for i, category in enumerate(self.categories)}
+
+        self._automaton = ahocorasick.Automaton()
+        for category, words in keywords.items():
+            for word in words:
+                word = normalize_description(word)
+                existing = self._automaton.get(word, None)
+                if existing is None or priority[category] < existing[0]:
+                    self._automaton.add_word(word, (priority[category], len(word)))
+        self._automaton.make_automaton()
+
+        self._patterns = [
+            (category, re.compile("|".join(f"(?:{p})" for p in category_patterns)))
+            for category, category_patterns in patterns.items()
+        ]
+        self.categorize_normalized = functools.lru_cache(maxsize=memo_size)(
+            self._match
+        )
+
+    def categorize(self, description: Optional[str]) -> str:
+        return self.categorize_normalized(normalize_description(description))
+
+    def categorize_batch(self, descriptions: Iterable[Optional[str]]) -> np.ndarray:
+        """
+        Categorizes many descriptions at once. Each distinct normalized
+        description is matched only once per batch.
+        """
+        normalized = np.array(
+            [normalize_description(description) for description in descriptions],
+            dtype=object,
+        )
+        if normalized.size == 0:
+            return np.array([], dtype=str)
+        unique, inverse = np.unique(normalized.astype(str), return_inverse=True)
+        categories = np.array(
+            [self.categorize_normalized(description) for description in unique.tolist()]
+        )
+        return categories[inverse]
+
+    def _match(self, text: str) -> str:
+        if not text:
+            return UNCATEGORIZED
+        best = None
+        for end, (priority, length) in self._automaton.iter(text):
+            start = end - length + 1
+            # Whole words only: "emi" must not match inside "premium"
+            if start > 0 and text[start - 1].isalnum():
+                continue
+            if end + 1 < len(text) and text[end + 1].isalnum():
+                continue
+            # The most specific (longest) keyword wins; priority breaks ties
+            if best is None or (-length, priority) < best:
+                best = (-length, priority)
+        if best is not None:
+            return self.categories[best[1]]
+        for category, pattern in self._patterns:
+            if pattern.search(text):
+                return category
+        return UNCATEGORIZED
+
+
+@functools.lru_cache(maxsize=1)
+def default_categorizer() -> Categorizer:
+    print("Reached " + inspect.currentframe().f_code.co_name)
+    return Categorizer()
+
+
+def monthly_category_totals(
+    categories: np.ndarray, months: np.ndarray, amounts: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sums amounts per (category, month).
+
+    Returns the category labels, the months and a matrix of totals with one
+    row per category and one column per month.
+    """
+    keep = ~np.isnat(months)
+    category_labels, category_index = np.unique(categories[keep], return_inverse=True)
+    month_labels, month_index = np.unique(months[keep], return_inverse=True)
+    totals = np.zeros((category_labels.size, month_labels.size), dtype=np.float64)
+    np.add.at(totals, (category_index, month_index), np.nan_to_num(amounts[keep]))
+    return category_labels, month_labels, totals
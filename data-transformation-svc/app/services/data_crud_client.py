@@ -1,4 +1,6 @@
 import aiohttp
+import gzip
+import orjson
 from typing import Dict, List, Optional
 from app.config import DATA_CRUD_SERVICE_URL
 
@@ -30,10 +32,17 @@ class DataCRUDClient:
     async def create_transactions(
         self, applicant_id: str, transactions: List[Dict]
     ) -> Optional[List[Dict]]:
+        # Statements can run to tens of thousands of rows, so the bulk body is
+        # serialized with orjson and gzip-compressed before it goes on the wire.
+        body = gzip.compress(orjson.dumps(transactions), compresslevel=5)
         async with aiohttp.ClientSession() as session:
             async with session.post(
                 f"{self.base_url}/applicants/{applicant_id}/transactions/bulk/",
-                json=transactions,
+                data=body,
+                headers={
+                    "Content-Type": "application/json",
+                    "Content-Encoding": "gzip",
+                },
             ) as response:
                 if response.status == 201:
                     return await response.json()
@@ -1,56 +1,45 @@
 # ./data-transformation-svc/app/services/kfi_calculator.py
-import pandas as pd
 import numpy as np
-from typing import Dict, List, Any
+from typing import Dict, Any
 import inspect
 from app.models.key_financial_indicator import KeyFinancialIndicator
+from app.models.transaction_batch import TransactionBatch
+from app.services.categorizer import default_categorizer, monthly_category_totals
 
 
-def calculate_kfi(transactions: List[Dict[str, Any]]) -> Dict[str, Any]:
+def calculate_kfi(batch: TransactionBatch) -> Dict[str, Any]:
     """
-    Calculates Key Financial Indicators (KFIs) from a list of transactions.
+    Calculates Key Financial Indicators (KFIs) from a batch of transactions.
 
     Args:
-        transactions: A list of dictionaries, where each dictionary represents a transaction.
+        batch: The applicant's transactions in columnar form.
 
     Returns:
         A dictionary containing the calculated KFIs, with NaN values replaced by appropriate defaults.
     """
     print("Reached " + inspect.currentframe().f_code.co_name)
-    df = pd.DataFrame(transactions)
 
-    if df.empty:
+    if len(batch) == 0:
         # Return a dictionary with default values (all 0.0 for consistency)
         return KeyFinancialIndicator().model_dump(exclude_none=True)
 
-    df["date"] = pd.to_datetime(df["date"])
-    df["month"] = df["date"].dt.to_period("M")
+    months = batch.dates.astype("datetime64[M]")
+    amounts = np.nan_to_num(batch.amounts, nan=0.0)
+    balances = np.nan_to_num(batch.balances, nan=0.0)
+    transaction_types = batch.transaction_types
 
-    df["amount"] = pd.to_numeric(df["amount"], errors="coerce").fillna(0)
-    df["balance"] = pd.to_numeric(df["balance"], errors="coerce").fillna(0)
-    df["transaction_type"] = df["transaction_type"].astype(str)
+    is_credit = transaction_types == "credit"
+    is_debit = transaction_types == "debit"
 
-    monthly_income = (
-        df[df["transaction_type"] == "credit"].groupby("month")["amount"].sum()
-    )
-    monthly_expenses = (
-        df[df["transaction_type"] == "debit"].groupby("month")["amount"].sum()
-    )
-
-    monthly_data = pd.DataFrame(
-        {
-            "monthly_income": monthly_income,
-            "monthly_expenses": monthly_expenses,
-        }
-    )
-    monthly_data = monthly_data.fillna(0)
-    monthly_data["net_monthly_income"] = (
-        monthly_data["monthly_income"] - monthly_data["monthly_expenses"]
-    )
+    # Months that have at least one credit or debit, mirroring a groupby over
+    # the income and expense series followed by an outer join.
+    active_months = np.unique(months[(is_credit | is_debit) & ~np.isnat(months)])
+    monthly_income = _monthly_sum(active_months, months[is_credit], amounts[is_credit])
+    monthly_expenses = _monthly_sum(active_months, months[is_debit], amounts[is_debit])
 
-    total_credits = df[df["transaction_type"] == "credit"]["amount"].sum()
-    total_debits = df[df["transaction_type"] == "debit"]["amount"].sum()
-    months_in_period = df["month"].nunique()
+    total_credits = amounts[is_credit].sum()
+    total_debits = amounts[is_debit].sum()
+    months_in_period = np.unique(months[~np.isnat(months)]).size
 
     MI = total_credits / months_in_period if months_in_period > 0 else 0.0
     ME = total_debits / months_in_period if months_in_period > 0 else 0.0
@@ -61,21 +50,37 @@ def calculate_kfi(transactions: List[Dict[str, Any]]) -> Dict[str, Any]:
     else:
         SR = 0.0
 
-    average_account_balance = df["balance"].mean()
+    average_account_balance = balances.mean()
 
     # Liquidity Ratio: Fallback to 0.0 if expenses are 0
     LR = average_account_balance / ME if ME != 0 else 0.0
 
     # Coefficient of Variation: Calculate std and mean separately, then divide
-    income_std = monthly_data["monthly_income"].std()
-    income_mean = monthly_data["monthly_income"].mean()
+    income_std = _sample_std(monthly_income)
+    income_mean = _mean(monthly_income)
     income_cv = income_std / income_mean if income_mean != 0 else 0.0
 
-    expense_std = monthly_data["monthly_expenses"].std()
-    expense_mean = monthly_data["monthly_expenses"].mean()
+    expense_std = _sample_std(monthly_expenses)
+    expense_mean = _mean(monthly_expenses)
     expense_cv = expense_std / expense_mean if expense_mean != 0 else 0.0
 
-    overdrafts = df[df["balance"] < 0].shape[0]
+    overdrafts = np.count_nonzero(balances < 0)
+
+    # Spending categories: average per month over the statement period, like MI/ME
+    categories = default_categorizer().categorize_batch(batch.descriptions)
+    credits_by_category = _category_monthly_average(
+        categories[is_credit], months[is_credit], amounts[is_credit], months_in_period
+    )
+    debits_by_category = _category_monthly_average(
+        categories[is_debit], months[is_debit], amounts[is_debit], months_in_period
+    )
+    monthly_payroll_income = credits_by_category.get("payroll", 0.0)
+    monthly_rent = debits_by_category.get("rent", 0.0)
+    monthly_loan_repayments = debits_by_category.get("loan_repayment", 0.0)
+    monthly_gambling_spend = debits_by_category.get("gambling", 0.0)
+
+    debt_service_ratio = monthly_loan_repayments / MI if MI != 0 else 0.0
+    gambling_spend_ratio = monthly_gambling_spend / ME if ME != 0 else 0.0
 
     S_IS = 1 / (1 + income_cv) if income_cv != 0 else 1.0
     S_ES = 1 / (1 + expense_cv) if expense_cv != 0 else 1.0
@@ -85,7 +90,7 @@ def calculate_kfi(transactions: List[Dict[str, Any]]) -> Dict[str, Any]:
 
     # Helper function to handle NaN values
     def replace_nan(value):
-        return 0.0 if pd.isna(value) else float(value)
+        return 0.0 if np.isnan(value) else float(value)
 
     return {
         "monthly_income": replace_nan(MI),
@@ -102,4 +107,38 @@ def calculate_kfi(transactions: List[Dict[str, Any]]) -> Dict[str, Any]:
         "savings_rate_score": replace_nan(S_SR),
         "liquidity_ratio_score": replace_nan(S_LR),
         "overdraft_penalty_score": replace_nan(S_OP),
-    }
\ No newline at end of file
+        "monthly_payroll_income": replace_nan(monthly_payroll_income),
+        "monthly_rent": replace_nan(monthly_rent),
+        "monthly_loan_repayments": replace_nan(monthly_loan_repayments),
+        "monthly_gambling_spend": replace_nan(monthly_gambling_spend),
+        "debt_service_ratio": replace_nan(debt_service_ratio),
+        "gambling_spend_ratio": replace_nan(gambling_spend_ratio),
+    }
+
+
+def _category_monthly_average(
+    categories: np.ndarray, months: np.ndarray, amounts: np.ndarray, months_in_period: int
+) -> Dict[str, float]:
+    if months_in_period == 0:
+        return {}
+    labels, _, totals = monthly_category_totals(categories, months, amounts)
+    return dict(zip(labels.tolist(), (totals.sum(axis=1) / months_in_period).tolist()))
+
+
+def _monthly_sum(
+    active_months: np.ndarray, months: np.ndarray, amounts: np.ndarray
+) -> np.ndarray:
+    keep = ~np.isnat(months)
+    positions = np.searchsorted(active_months, months[keep])
+    return np.bincount(
+        positions, weights=amounts[keep], minlength=active_months.size
+    ).astype(np.float64)
+
+
+def _mean(values: np.ndarray) -> float:
+    return float(values.mean()) if values.size else float("nan")
+
+
+def _sample_std(values: np.ndarray) -> float:
+    # Sample standard deviation (ddof=1); undefined for fewer than two months
+    return float(values.std(ddof=1)) if values.size > 1 else float("nan")
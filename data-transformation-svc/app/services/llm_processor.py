@@ -1,28 +1,56 @@
 import os
-from typing import List, Dict
-import csv
-from openai import AsyncOpenAI
+from typing import TYPE_CHECKING, Dict, List, Optional
 from dotenv import load_dotenv
 from app.config import GROQ_BASE_URL, LLM_MODEL, GROQ_API_KEY
-from app.utils.prompts import TRANSACTION_EXTRACTION_PROMPT
+from app.utils.prompts import SECTION_REEXTRACTION_PROMPT, TRANSACTION_EXTRACTION_PROMPT
 import inspect
 import re
 
+if TYPE_CHECKING:
+    from app.models.transaction_batch import TransactionBatch
 
 load_dotenv()
 
-client = AsyncOpenAI(api_key=GROQ_API_KEY, base_url=GROQ_BASE_URL)
+client = None
 
 
-async def process_text_with_llm(statement_text: str) -> List[Dict[str, str]]:
+def get_client():
+    # openai is imported on first use (or by the startup warm-up) so that
+    # importing this module stays cheap.
+    global client
+    if client is None:
+        from openai import AsyncOpenAI
+
+        client = AsyncOpenAI(api_key=GROQ_API_KEY, base_url=GROQ_BASE_URL)
+    return client
+
+
+async def process_text_with_llm(statement_text: str) -> "TransactionBatch":
     print("Reached " + inspect.currentframe().f_code.co_name)
     messages = [
         {"role": "system", "content": TRANSACTION_EXTRACTION_PROMPT},
         {"role": "user", "content": statement_text},
     ]
+    return await _extract_transactions(messages)
 
+
+async def reextract_section_with_llm(
+    section_text: str, opening_balance: Optional[float]
+) -> "TransactionBatch":
+    """Re-runs extraction on one section of the statement, not the whole document."""
+    print("Reached " + inspect.currentframe().f_code.co_name)
+    opening = "unknown" if opening_balance is None else f"{opening_balance:.2f}"
+    messages = [
+        {"role": "system", "content": TRANSACTION_EXTRACTION_PROMPT},
+        {"role": "system", "content": SECTION_REEXTRACTION_PROMPT.format(opening_balance=opening)},
+        {"role": "user", "content": section_text},
+    ]
+    return await _extract_transactions(messages)
+
+
+async def _extract_transactions(messages: List[Dict[str, str]]) -> "TransactionBatch":
     try:
-        response = await client.chat.completions.create(
+        response = await get_client().chat.completions.create(
             model=LLM_MODEL, messages=messages, temperature=0.3, max_tokens=12000
         )
         generated_csv = response.choices[0].message.content.strip()
@@ -33,24 +61,20 @@ async def process_text_with_llm(statement_text: str) -> List[Dict[str, str]]:
         return _parse_csv_to_transactions(cleaned_csv)
     except Exception as e:
         print(f"Error processing text with LLM: {str(e)}")
-        return []
+        return _parse_csv_to_transactions("")
 
 
-def _parse_csv_to_transactions(csv_content: str) -> List[Dict[str, str]]:
+def _parse_csv_to_transactions(csv_content: str) -> "TransactionBatch":
     print("Reached " + inspect.currentframe().f_code.co_name)
-    transactions = []
+    # Deferred so numpy stays off the import path at startup (see services/warmup.py)
+    from app.models.transaction_batch import TransactionBatch
+
     print(csv_content)
     print("CSV CONTENT ENDS HERE ===============================")
     try:
-        csv_reader = csv.DictReader(line.strip() for line in csv_content.splitlines())
-        for row in csv_reader:
-            print(row)
-            print(row['balance'])
-            if not row['balance']:
-                row['balance'] = 0.0
-            transactions.append(row)
+        transactions = TransactionBatch.from_csv(csv_content)
     except Exception as e:
         print(f"Error parsing CSV content: {e}")
-        return []
-    print(transactions)
+        return TransactionBatch.from_csv("")
+    print(f"Parsed {len(transactions)} transactions")
     return transactions
@@ -1,4 +1,3 @@
-import pdfplumber
 import io
 from typing import Optional, Union
 import inspect
@@ -6,6 +5,8 @@ import inspect
 def parse_pdf(file_path: Union[str, bytes]) -> Optional[str]:
     print("Reached " + inspect.currentframe().f_code.co_name)
     try:
+        import pdfplumber  # Deferred: pdfplumber pulls in pdfminer and Pillow
+
         if isinstance(file_path, str):
             with pdfplumber.open(file_path) as pdf:
                 return _extract_text(pdf)
@@ -0,0 +1,185 @@
+# ./data-transformation-svc/app/services/reconciliation.py
+import asyncio
+import inspect
+import numpy as np
+from typing import List, NamedTuple, Optional, Tuple
+from app.models.transaction_batch import TransactionBatch
+from app.services.llm_processor import reextract_section_with_llm
+
+# Balances are printed to two decimals; anything beyond a cent is a real break
+BALANCE_TOLERANCE = 0.01
+# Breaks this many rows apart or closer are re-extracted as one section
+RANGE_MERGE_GAP = 3
+# Upper bound on extra LLM calls per statement
+MAX_REEXTRACTED_SECTIONS = 3
+# Extra lines kept around a section when its rows cannot be found in the text
+SECTION_PADDING_LINES = 2
+# A re-extracted section may differ from the rows it replaces by this share
+# of their count, or by SECTION_ROW_SLACK rows if that is more
+SECTION_ROW_TOLERANCE = 0.5
+SECTION_ROW_SLACK = 2
+
+
+class ReconciliationResult(NamedTuple):
+    broken_ranges: List[Tuple[int, int]]  # inclusive row ranges
+    checked: int  # row pairs with both balances and an amount
+    breaks: int
+    confidence: Optional[float]  # share of all row pairs checked and reconciled
+
+
+def reconcile(batch: TransactionBatch) -> ReconciliationResult:
+    """
+    Checks that every row's balance equals the previous balance plus or minus
+    its amount, according to its transaction type.
+
+    Statements list transactions oldest-first or newest-first, so both
+    orders are checked and the one with fewer breaks is used. Pairs where a
+    balance or the amount is missing cannot be checked; they are not counted
+    as breaks but do lower the confidence.
+    """
+    print("Reached " + inspect.currentframe().f_code.co_name)
+    if len(batch) < 2:
+        return ReconciliationResult([], 0, 0, None)
+
+    signed_amounts = np.where(
+        batch.transaction_types == "credit",
+        batch.amounts,
+        np.where(batch.transaction_types == "debit", -batch.amounts, np.nan),
+    )
+    balances = batch.balances
+
+    # Oldest first: balance[i] = balance[i - 1] + signed[i]
+    ascending_error = balances[1:] - (balances[:-1] + signed_amounts[1:])
+    # Newest first: balance[i] = balance[i + 1] + signed[i]
+    descending_error = balances[:-1] - (balances[1:] + signed_amounts[:-1])
+
+    checked = ~np.isnan(ascending_error)
+    ascending_broken = checked & (np.abs(np.nan_to_num(ascending_error)) > BALANCE_TOLERANCE)
+    descending_checked = ~np.isnan(descending_error)
+    descending_broken = descending_checked & (
+        np.abs(np.nan_to_num(descending_error)) > BALANCE_TOLERANCE
+    )
+    if np.count_nonzero(descending_broken) < np.count_nonzero(ascending_broken):
+        checked, broken = descending_checked, descending_broken
+    else:
+        broken = ascending_broken
+
+    # Pair k compares rows k and k + 1
+    broken_pairs = np.flatnonzero(broken)
+    broken_ranges = []
+    if broken_pairs.size:
+        splits = np.flatnonzero(np.diff(broken_pairs) > RANGE_MERGE_GAP) + 1
+        broken_ranges = [
+            (int(group[0]), int(group[-1]) + 1)
+            for group in np.split(broken_pairs, splits)
+        ]
+
+    checked_count = int(np.count_nonzero(checked))
+    breaks = int(broken_pairs.size)
+    confidence = (checked_count - breaks) / (len(batch) - 1) if checked_count else None
+    return ReconciliationResult(broken_ranges, checked_count, breaks, confidence)
+
+
+async def reconcile_and_reextract(
+    statement_text: str, batch: TransactionBatch
+) -> TransactionBatch:
+    """
+    Re-extracts only the statement sections whose rows fail reconciliation
+    and splices the new rows in wherever they reconcile better.
+
+    A section is only spliced in when every re-extracted row has an amount and
+    a balance, its row count is close to that of the rows it replaces, and the
+    result has fewer breaks without more unchecked pairs. Unchecked pairs are
+    compared rather than checked ones so that dropping a hallucinated row,
+    which removes a pair, still counts as a fix.
+    """
+    print("Reached " + inspect.currentframe().f_code.co_name)
+    result = reconcile(batch)
+    if not result.broken_ranges:
+        return batch
+
+    lines = statement_text.splitlines()
+    ranges = result.broken_ranges[:MAX_REEXTRACTED_SECTIONS]
+    sections = [_section_for_rows(lines, batch, start, end) for start, end in ranges]
+    reextracted = await asyncio.gather(
+        *(
+            reextract_section_with_llm(
+                "\n".join(lines[first_line:last_line]),
+                _opening_balance(batch, start),
+            )
+            for (start, _), (first_line, last_line) in zip(ranges, sections)
+        )
+    )
+
+    # Splice from the end so earlier row ranges keep their indices
+    breaks, unchecked = result.breaks, _unchecked_pairs(batch, result)
+    for (start, end), section_batch in reversed(list(zip(ranges, reextracted))):
+        if not _is_plausible_section(section_batch, end - start + 1):
+            continue
+        candidate = TransactionBatch.concatenate(
+            [batch[:start], section_batch, batch[end + 1 :]]
+        )
+        candidate_result = reconcile(candidate)
+        candidate_unchecked = _unchecked_pairs(candidate, candidate_result)
+        if candidate_result.breaks < breaks and candidate_unchecked <= unchecked:
+            batch = candidate
+            breaks, unchecked = candidate_result.breaks, candidate_unchecked
+
+    print(f"Balance breaks: {result.breaks} before re-extraction, {breaks} after")
+    return batch
+
+
+def _unchecked_pairs(batch: TransactionBatch, result: ReconciliationResult) -> int:
+    return max(len(batch) - 1, 0) - result.checked
+
+
+def _is_plausible_section(section_batch: TransactionBatch, replaced_rows: int) -> bool:
+    if len(section_batch) == 0 or section_batch.invalid_rows().size:
+        return False
+    if np.isnan(section_batch.amounts).any() or np.isnan(section_batch.balances).any():
+        return False
+    allowed = max(SECTION_ROW_SLACK, int(replaced_rows * SECTION_ROW_TOLERANCE))
+    return abs(len(section_batch) - replaced_rows) <= allowed
+
+
+def _opening_balance(batch: TransactionBatch, start: int) -> Optional[float]:
+    if start == 0 or np.isnan(batch.balances[start - 1]):
+        return None
+    return float(batch.balances[start - 1])
+
+
+def _section_for_rows(
+    lines: List[str], batch: TransactionBatch, start: int, end: int
+) -> Tuple[int, int]:
+    """
+    Maps an inclusive row range to a half-open range of statement lines.
+
+    The section is bounded by the lines of the consistent rows on either side
+    of the range; when those cannot be found, the row positions are scaled to
+    line positions instead.
+    """
+    before = _find_row_line(lines, batch, start - 1, 0) if start > 0 else -1
+    if before is None:
+        before = int(start * len(lines) / len(batch)) - SECTION_PADDING_LINES
+    after = len(lines)
+    if end + 1 < len(batch):
+        after = _find_row_line(lines, batch, end + 1, max(before + 1, 0))
+        if after is None:
+            after = int((end + 1) * len(lines) / len(batch)) + SECTION_PADDING_LINES
+    first_line = max(before + 1, 0)
+    return first_line, max(min(after, len(lines)), first_line + 1)
+
+
+def _find_row_line(
+    lines: List[str], batch: TransactionBatch, row: int, search_from: int
+) -> Optional[int]:
+    value = batch.balances[row]
+    if np.isnan(value):
+        value = batch.amounts[row]
+    if np.isnan(value):
+        return None
+    candidates = (f"{value:,.2f}", f"{value:.2f}")
+    for i in range(search_from, len(lines)):
+        if any(candidate in lines[i] for candidate in candidates):
+            return i
+    return None
@@ -0,0 +1,43 @@
+import asyncio
+import importlib
+import inspect
+import time
+from typing import Dict
+
+from app.services.llm_processor import get_client
+
+# Modules that are deliberately kept off the import path of app.main and are
+# loaded in the background once the server is already answering health checks.
+HEAVY_MODULES = (
+    "numpy",
+    "pdfplumber",
+    "openai",
+    "app.services.categorizer",
+    "app.services.kfi_calculator",
+    "app.services.reconciliation",
+)
+
+state = {"ready": False, "error": None, "import_seconds": {}}
+
+
+def _import_heavy_modules() -> Dict[str, float]:
+    timings = {}
+    for module_name in HEAVY_MODULES:
+        start = time.perf_counter()
+        importlib.import_module(module_name)
+        timings[module_name] = round(time.perf_counter() - start, 4)
+    return timings
+
+
+async def warm_up() -> None:
+    print("Reached " + inspect.currentframe().f_code.co_name)
+    try:
+        state["import_seconds"] = await asyncio.to_thread(_import_heavy_modules)
+        get_client()
+        # Compile the keyword automaton now rather than on the first statement
+        categorizer = importlib.import_module("app.services.categorizer")
+        await asyncio.to_thread(categorizer.default_categorizer)
+        state["ready"] = True
+    except Exception as e:
+        print(f"Error during warm-up: {str(e)}")
+        state["error"] = str(e)
@@ -18,3 +18,13 @@ Add the headers given above.
 Do not add markdown code such as ```csv ```. Do not prepend with 'csv'. Only output the data with one transaction per line and no additional text or explanations.
     """
 )
+
+SECTION_REEXTRACTION_PROMPT = (
+    """
+The text below is only a section of a bank statement. A previous extraction of this section produced rows whose balances do not reconcile: each row's balance must equal the previous row's balance plus the amount for a credit, or minus the amount for a debit.
+
+The balance on the row immediately preceding this section in the statement is: {opening_balance}
+
+Extract every transaction in this section again, in the order it appears, without skipping or inventing rows. Use exactly the same CSV format and headers as instructed above.
+    """
+)
@@ -0,0 +1,57 @@
+"""
+Throughput of the transaction categorizer, in descriptions per minute.
+
+Generates descriptions the way bank statements print them: a few hundred
+merchants, each with a varying reference number, so most lines repeat a
+merchant string seen before. Reports a cold run (empty memo) and a warm run.
+
+Usage (from ./data-transformation-svc):
+    python benchmarks/categorizer.py [descriptions]
+"""
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.categorizer import Categorizer  # noqa: E402
+
+MERCHANTS = [
+    "SALARY ACME CORP", "NACH-DR-HDB FINANCIAL", "HOUSE RENT MR SHARMA",
+    "BET365 LTD", "DREAM11", "BESCOM ELECTRICITY", "ATM WDL", "AMAZON PAY",
+    "SWIGGY", "UBER TRIP", "TESCO STORES", "NETFLIX.COM",
+] + [f"MERCHANT {i}" for i in range(300)]
+
+
+def make_descriptions(count: int) -> list:
+    rng = random.Random(7)
+    return [
+        f"UPI/{rng.randint(10**9, 10**10)}/{rng.choice(MERCHANTS)}/{rng.randint(1000, 9999)}"
+        for _ in range(count)
+    ]
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    descriptions = make_descriptions(count)
+
+    start = time.perf_counter()
+    categorizer = Categorizer()
+    print(f"Compiled rules in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    for run in ("cold", "warm"):
+        start = time.perf_counter()
+        categories = categorizer.categorize_batch(descriptions)
+        seconds = time.perf_counter() - start
+        print(f"{run:>5}: {count / seconds * 60:14,.0f} descriptions/min")
+
+    labels, counts = np.unique(categories, return_counts=True)
+    for label, label_count in zip(labels.tolist(), counts.tolist()):
+        print(f"{label:>16}: {label_count}")
+
+
+if __name__ == "__main__":
+    main()
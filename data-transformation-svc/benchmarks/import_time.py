@@ -0,0 +1,58 @@
+"""
+Measures the import cost of the service, per module.
+
+Runs ``python -X importtime`` in a fresh interpreter so nothing is cached, then
+prints the cumulative import time of the app modules and of the heavy
+third-party dependencies that are meant to stay off the startup path.
+
+Usage (from ./data-transformation-svc):
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py app.services.kfi_calculator
+"""
+import os
+import subprocess
+import sys
+
+from typing import Dict
+
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TRACKED_PREFIXES = ("app", "numpy", "pdfplumber", "openai", "fastapi", "pydantic")
+
+
+def measure(target: str) -> Dict[str, int]:
+    """Returns cumulative import time in microseconds for every module imported by `target`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=SERVICE_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        # Format: "import time:  self [us] |  cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module_name = line[len("import time:"):].split("|")
+        timings[module_name.strip()] = int(cumulative)
+    return timings
+
+
+def main() -> None:
+    target = sys.argv[1] if len(sys.argv) > 1 else "app.main"
+    timings = measure(target)
+    tracked = {
+        name: micros
+        for name, micros in timings.items()
+        if name.split(".")[0] in TRACKED_PREFIXES
+    }
+
+    print(f"Import cost of {target}: {timings.get(target, 0) / 1000:.1f} ms")
+    for name, micros in sorted(tracked.items(), key=lambda item: -item[1]):
+        print(f"{micros / 1000:10.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Compares CPU time and peak allocations of the row-oriented ingestion path
+against `TransactionBatch` on a synthetic statement.
+
+The row-oriented path is the one `process_and_store_transactions` used before
+the columnar batch: csv.DictReader -> strptime -> Transaction -> model_dump ->
+isoformat, with the KFIs computed from the resulting dicts.
+
+Usage (from ./data-transformation-svc):
+    python benchmarks/transaction_batch.py [rows]
+"""
+import contextlib
+import csv
+import io
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.transaction import Transaction  # noqa: E402
+from app.models.transaction_batch import TransactionBatch  # noqa: E402
+from app.services.kfi_calculator import calculate_kfi  # noqa: E402
+
+
+def make_statement(rows: int) -> str:
+    rng = random.Random(42)
+    start = date(2024, 1, 1)
+    balance = 10000.0
+    lines = ["date,description,transaction_type,amount,balance,currency"]
+    for i in range(rows):
+        transaction_type = "credit" if rng.random() < 0.3 else "debit"
+        amount = round(rng.uniform(5, 2500), 2)
+        balance += amount if transaction_type == "credit" else -amount
+        day = start + timedelta(days=i * 365 // rows)
+        lines.append(
+            f'{day.isoformat()},"UPI/{rng.randint(1000, 9999)}/MERCHANT {i % 300}",'
+            f"{transaction_type},{amount},{balance:.2f},INR"
+        )
+    return "\n".join(lines)
+
+
+def row_oriented(csv_content: str):
+    rows = list(csv.DictReader(line.strip() for line in csv_content.splitlines()))
+    for row in rows:
+        row["date"] = datetime.strptime(row["date"], "%Y-%m-%d")
+    dumps = [Transaction(**row).model_dump(exclude_none=True) for row in rows]
+    records = [
+        {
+            key: value.isoformat() if isinstance(value, datetime) else value
+            for key, value in record.items()
+        }
+        for record in dumps
+    ]
+    return records, calculate_kfi(TransactionBatch.from_records(dumps))
+
+
+def columnar(csv_content: str):
+    batch = TransactionBatch.from_csv(csv_content)
+    batch.invalid_rows()
+    return batch.to_records(), calculate_kfi(batch)
+
+
+def measure(func, csv_content: str):
+    # calculate_kfi prints progress markers; keep them out of the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.process_time()
+        func(csv_content)
+        cpu_seconds = time.process_time() - start
+
+        tracemalloc.start()
+        func(csv_content)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return cpu_seconds, peak
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    csv_content = make_statement(rows)
+    print(f"{rows} rows")
+    for name, func in (("row-oriented", row_oriented), ("columnar", columnar)):
+        cpu_seconds, peak = measure(func, csv_content)
+        print(f"{name:>14}: {cpu_seconds * 1000:8.1f} ms CPU  {peak / 1024 / 1024:7.2f} MiB peak")
+
+
+if __name__ == "__main__":
+    main()
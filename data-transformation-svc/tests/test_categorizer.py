@@ -0,0 +1,48 @@
+import pytest
+
+from app.services.categorizer import UNCATEGORIZED, Categorizer
+
+
+@pytest.fixture(scope="module")
+def categorizer():
+    return Categorizer()
+
+
+@pytest.mark.parametrize(
+    "description, category",
+    [
+        # The longest keyword wins over a shorter one from another category
+        ("HOUSE RENT CORAL HEIGHTS", "rent"),
+        ("NEFT SALARY MPL TECHNOLOGIES", "payroll"),
+        ("Loan repayment to Coral Finance", "loan_repayment"),
+        # Bare tokens that are also names or words do not categorize on their own
+        ("Transfer to Emi Smith", UNCATEGORIZED),
+        ("UPI/1234567890/CORAL CAFE", UNCATEGORIZED),
+        ("NFS/CASH WDL/12345678/MG ROAD", "cash_withdrawal"),
+        # Qualified forms still match
+        ("CORAL BET 0042", "gambling"),
+        ("MPL GAMES/UPI/998877", "gambling"),
+        ("HOME LOAN EMI 0423", "loan_repayment"),
+        ("EMI DEBIT 12/24", "loan_repayment"),
+        ("SAL CR OCT", "payroll"),
+        # Whole words only
+        ("PREMIUM SUBSCRIPTION", UNCATEGORIZED),
+        ("", UNCATEGORIZED),
+    ],
+)
+def test_categorize(categorizer, description, category):
+    assert categorizer.categorize(description) == category
+
+
+def test_equal_length_matches_use_category_order():
+    categorizer = Categorizer(keywords={"first": ("abc",), "second": ("xyz",)}, patterns={})
+    assert categorizer.categorize("xyz abc") == "first"
+
+
+def test_categorize_batch_matches_categorize(categorizer):
+    descriptions = [
+        "HOUSE RENT CORAL HEIGHTS", None, "Transfer to Emi Smith", "HOUSE RENT CORAL HEIGHTS",
+    ]
+    assert categorizer.categorize_batch(descriptions).tolist() == [
+        categorizer.categorize(description) for description in descriptions
+    ]
@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+
+from app.models.transaction_batch import TransactionBatch
+from app.services import reconciliation
+from app.services.reconciliation import reconcile, reconcile_and_reextract
+
+HEADER = "date,description,transaction_type,amount,balance,currency"
+
+# Oldest first, opening balance 1000.00
+ROWS = [
+    "2024-01-01,SALARY,credit,100,1100,INR",
+    "2024-01-02,GROCERIES,debit,50,1050,INR",
+    "2024-01-03,FUEL,debit,20,1030,INR",
+    "2024-01-05,REFUND,credit,200,1230,INR",
+    "2024-01-06,PHARMACY,debit,30,1200,INR",
+    "2024-01-07,ELECTRICITY,debit,100,1100,INR",
+]
+# Consistent with the row before it, but not with the one after it
+HALLUCINATED_ROW = "2024-01-04,COFFEE,debit,40,990,INR"
+
+
+def make_batch(rows):
+    return TransactionBatch.from_csv("\n".join([HEADER, *rows]))
+
+
+def statement_lines(rows):
+    lines = ["ACME BANK STATEMENT", "Date Description Debit Credit Balance"]
+    for row in rows:
+        date, description, _, amount, balance, _ = row.split(",")
+        lines.append(f"{date} {description} {float(amount):,.2f} {float(balance):,.2f}")
+    lines.append("Closing balance")
+    return lines
+
+
+def test_reconcile_oldest_first():
+    result = reconcile(make_batch(ROWS))
+    assert result.broken_ranges == []
+    assert (result.checked, result.breaks, result.confidence) == (5, 0, 1.0)
+
+
+def test_reconcile_newest_first():
+    result = reconcile(make_batch(list(reversed(ROWS))))
+    assert result.broken_ranges == []
+    assert (result.checked, result.breaks) == (5, 0)
+
+
+def test_reconcile_reports_break_and_confidence():
+    rows = list(ROWS)
+    rows[3] = "2024-01-05,REFUND,credit,200,1250,INR"  # should be 1230
+    result = reconcile(make_batch(rows))
+    # The wrong balance breaks both pairs it is part of
+    assert result.broken_ranges == [(2, 4)]
+    assert (result.checked, result.breaks) == (5, 2)
+    assert result.confidence == pytest.approx(3 / 5)
+
+
+def test_reconcile_missing_balance_lowers_confidence_without_breaks():
+    rows = list(ROWS)
+    rows[2] = "2024-01-03,FUEL,debit,20,,INR"
+    result = reconcile(make_batch(rows))
+    assert result.broken_ranges == []
+    assert (result.checked, result.breaks) == (3, 0)
+    assert result.confidence == pytest.approx(3 / 5)
+
+
+def test_reconcile_merges_nearby_breaks():
+    rows = [f"2024-01-{day:02d},X,debit,10,{1000 - 10 * day},INR" for day in range(1, 13)]
+    rows[1] = "2024-01-02,X,debit,10,1,INR"
+    rows[3] = "2024-01-04,X,debit,10,1,INR"
+    rows[10] = "2024-01-11,X,debit,10,1,INR"
+    result = reconcile(make_batch(rows))
+    assert result.broken_ranges == [(0, 4), (9, 11)]
+
+
+def test_reconcile_needs_two_rows():
+    assert reconcile(make_batch(ROWS[:1])).confidence is None
+
+
+def test_section_is_anchored_on_neighbouring_balances():
+    rows = ROWS[:3] + [HALLUCINATED_ROW] + ROWS[3:]
+    lines = statement_lines(rows)
+    first_line, last_line = reconciliation._section_for_rows(lines, make_batch(rows), 3, 4)
+    # Lines of rows 3 and 4, between the lines of rows 2 and 5
+    assert lines[first_line:last_line] == lines[5:7]
+
+
+def reextract_stub(monkeypatch, section_rows):
+    calls = []
+
+    async def fake_reextract(section_text, opening_balance):
+        calls.append((section_text, opening_balance))
+        return make_batch(section_rows)
+
+    monkeypatch.setattr(reconciliation, "reextract_section_with_llm", fake_reextract)
+    return calls
+
+
+def test_reextract_drops_hallucinated_row(monkeypatch):
+    rows = ROWS[:3] + [HALLUCINATED_ROW] + ROWS[3:]
+    batch = make_batch(rows)
+    assert reconcile(batch).broken_ranges == [(3, 4)]
+    calls = reextract_stub(monkeypatch, [ROWS[3]])
+
+    result = asyncio.run(reconcile_and_reextract("\n".join(statement_lines(rows)), batch))
+
+    assert len(calls) == 1
+    section_text, opening_balance = calls[0]
+    assert "COFFEE" in section_text and "SALARY" not in section_text
+    assert opening_balance == 1030.0
+    assert result.descriptions.tolist() == [row.split(",")[1] for row in ROWS]
+    assert reconcile(result).confidence == 1.0
+
+
+@pytest.mark.parametrize(
+    "section_rows",
+    [
+        # A blank balance cannot be checked, so it must not pass as a fix
+        ["2024-01-05,REFUND,credit,200,,INR"],
+        # Far more rows than the two being replaced
+        [ROWS[3]] * 6,
+        # Does not reduce the number of breaks
+        [HALLUCINATED_ROW, ROWS[3]],
+        [],
+    ],
+)
+def test_reextract_keeps_batch_when_section_is_rejected(monkeypatch, section_rows):
+    rows = ROWS[:3] + [HALLUCINATED_ROW] + ROWS[3:]
+    batch = make_batch(rows)
+    reextract_stub(monkeypatch, section_rows)
+
+    result = asyncio.run(reconcile_and_reextract("\n".join(statement_lines(rows)), batch))
+
+    assert result is batch
+
+
+def test_reextract_skips_consistent_batch(monkeypatch):
+    calls = reextract_stub(monkeypatch, ROWS)
+    batch = make_batch(ROWS)
+    assert asyncio.run(reconcile_and_reextract("", batch)) is batch
+    assert calls == []
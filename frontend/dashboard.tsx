@@ -18,7 +18,7 @@ import { ExpensePieChart } from "./expense-pie-chart"
 import { Avatar, AvatarImage, AvatarFallback } from "@/components/ui/avatar"
 import { Tooltip, TooltipContent, TooltipProvider, TooltipTrigger } from "./components/ui/tooltip"
 
-import { fetchApplicantData } from "./lib/api"
+import { ChangeEvent, fetchApplicantData, subscribeToApplicantEvents } from "./lib/api"
 import { LoadingOverlay } from "./components/ui/loading-overlay"
 
 // Define interfaces for the data structures
@@ -58,6 +58,55 @@ interface ApplicantData {
   key_financial_indicators: KeyFinancialIndicators | null;
 }
 
+function applyChangeEvent(applicant: ApplicantData, event: ChangeEvent): ApplicantData {
+  const fields = event.fields ?? {};
+  switch (event.collection) {
+    case "applicants":
+      return event.operation === "delete" ? applicant : { ...applicant, ...fields };
+    case "key_financial_indicators":
+      if (event.operation === "delete") {
+        return { ...applicant, key_financial_indicators: null };
+      }
+      return {
+        ...applicant,
+        key_financial_indicators: {
+          ...applicant.key_financial_indicators,
+          ...fields,
+          id: event.document_id,
+        } as KeyFinancialIndicators,
+      };
+    case "transactions": {
+      const transactions = applicant.transactions ?? [];
+      if (event.operation === "delete") {
+        return { ...applicant, transactions: transactions.filter((t) => t.id !== event.document_id) };
+      }
+      if (event.operation === "update") {
+        return {
+          ...applicant,
+          transactions: transactions.map((t) => (t.id === event.document_id ? { ...t, ...fields } : t)),
+        };
+      }
+      if (event.operation === "insert_many") {
+        const known = new Set(transactions.map((t) => t.id));
+        const added = (event.documents ?? []).filter((document) => !known.has(document.id));
+        if (added.length === 0) {
+          return applicant;
+        }
+        return { ...applicant, transactions: [...transactions, ...(added as unknown as Transaction[])] };
+      }
+      if (transactions.some((t) => t.id === event.document_id)) {
+        return applicant;
+      }
+      return {
+        ...applicant,
+        transactions: [...transactions, { ...fields, id: event.document_id } as Transaction],
+      };
+    }
+    default:
+      return applicant;
+  }
+}
+
 interface DashboardProps {
   applicantId: string;
   onReset: () => void;
@@ -95,6 +144,17 @@ export default function Dashboard({ applicantId, onReset }: DashboardProps) {
     fetchData();
   }, [applicantId]);
 
+  // Apply pushed deltas instead of re-fetching the whole applicant
+  useEffect(() => {
+    return subscribeToApplicantEvents(applicantId, (event: ChangeEvent) => {
+      if (event.type === "resync") {
+        fetchApplicantData(applicantId).then((data) => data && setApplicantData(data));
+        return;
+      }
+      setApplicantData((current) => (current ? applyChangeEvent(current, event) : current));
+    });
+  }, [applicantId]);
+
 
   if (!applicantData) {
     return <LoadingOverlay />
@@ -8,4 +8,53 @@ export async function fetchApplicantData(applicantId: string) {
     }
     const data = await response.json();
     return data;
-}
\ No newline at end of file
+}
+
+export interface ChangeEvent {
+    type: "change" | "resync" | "heartbeat";
+    collection?: "applicants" | "transactions" | "key_financial_indicators";
+    operation?: "insert" | "insert_many" | "update" | "delete";
+    document_id?: string;
+    applicant_id?: string | null;
+    fields?: Record<string, unknown>;
+    // insert_many only: the inserted documents, each with its own id
+    count?: number;
+    documents?: Array<Record<string, unknown> & { id: string }>;
+}
+
+// Opens a WebSocket to data-crud-svc and calls onEvent with each per-document
+// delta for the applicant. Reconnects after a drop; returns a function that closes it.
+export function subscribeToApplicantEvents(
+    applicantId: string,
+    onEvent: (event: ChangeEvent) => void,
+): () => void {
+    let socket: WebSocket | null = null;
+    let closed = false;
+    let retryTimer: ReturnType<typeof setTimeout> | undefined;
+
+    const connect = () => {
+        socket = new WebSocket(`ws://localhost:8001/ws/events?applicant_id=${applicantId}`);
+        socket.onmessage = (message) => {
+            const event: ChangeEvent = JSON.parse(message.data);
+            if (event.type !== "heartbeat") {
+                onEvent(event);
+            }
+        };
+        socket.onclose = () => {
+            if (!closed) {
+                // Changes may have been missed while disconnected
+                retryTimer = setTimeout(() => {
+                    onEvent({ type: "resync" });
+                    connect();
+                }, 2000);
+            }
+        };
+    };
+
+    connect();
+    return () => {
+        closed = true;
+        clearTimeout(retryTimer);
+        socket?.close();
+    };
+}